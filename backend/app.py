@@ -1,21 +1,44 @@
 from flask import Flask, request, jsonify
 from scraper.ebay_spider import run_ebay_spider
 from scraper.amazon_spider import run_amazon_spider
-from database.db import initialize_db, add_product, fetch_all_products
+from database.db import initialize_db, add_products, fetch_all_products, fetch_products
 from database.backup import backup_database
 from logger import log_error, log_critical_error
+from types import MappingProxyType
+import base64
+import json
 import logging
 
 app = Flask(__name__)
 
+# Largest page /products will return; bigger `limit` values are clamped to this
+MAX_PAGE_SIZE = 200
+
+# Spider runners keyed by platform name
+SPIDERS = MappingProxyType({
+    "ebay": run_ebay_spider,
+    "amazon": run_amazon_spider,
+})
+
+def encode_cursor(after):
+    if after is None:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(list(after)).encode()).decode()
+
+def decode_cursor(token):
+    date_scraped, product_id = json.loads(base64.urlsafe_b64decode(token.encode()))
+    if not isinstance(date_scraped, str):
+        raise ValueError(token)
+    return date_scraped, int(product_id)
+
 # Initialize the database
 initialize_db()
 
 @app.route('/scrape', methods=['POST'])
 def scrape():
-    \"\"\"
+    """
     Scrapes eBay or Amazon based on the user's query.
-    \"\"\"
+    """
     data = request.json
     query = data.get("query", "")
     platform = data.get("platform", "ebay")
@@ -24,18 +47,16 @@ def scrape():
     if not query:
         return jsonify({"error": "Query is required"}), 400
 
+    run_spider = SPIDERS.get(platform)
+    if run_spider is None:
+        return jsonify({"error": "Unsupported platform"}), 400
+
     try:
         # Run the appropriate spider
-        if platform == "ebay":
-            results = run_ebay_spider(query, max_items)
-        elif platform == "amazon":
-            results = run_amazon_spider(query, max_items)
-        else:
-            return jsonify({"error": "Unsupported platform"}), 400
+        results = run_spider(query, max_items)
 
         # Store results in the database
-        for product in results:
-            add_product(product)
+        add_products(results)
 
         return jsonify({"message": "Scraping completed", "data": results})
     except Exception as e:
@@ -44,9 +65,34 @@ def scrape():
 
 @app.route('/products', methods=['GET'])
 def get_products():
-    \"\"\"
-    Fetch all products from the database.
-    \"\"\"
+    """
+    Fetch products from the database.
+
+    Without query parameters all products are returned. Passing `limit` and/or
+    `cursor` returns one page plus the cursor for the next page. `limit`
+    defaults to 50 and is capped at MAX_PAGE_SIZE.
+    """
+    if "limit" in request.args or "cursor" in request.args:
+        try:
+            limit = min(int(request.args.get("limit", 50)), MAX_PAGE_SIZE)
+            token = request.args.get("cursor")
+            after = decode_cursor(token) if token else None
+            if limit < 1:
+                raise ValueError(limit)
+        except (ValueError, TypeError):
+            return jsonify({"error": "Invalid pagination parameters"}), 400
+
+        try:
+            products, next_after = fetch_products(limit, after)
+            return jsonify({
+                "data": products,
+                "has_more": next_after is not None,
+                "next_cursor": encode_cursor(next_after)
+            })
+        except Exception as e:
+            log_error(f"Error fetching products: {e}")
+            return jsonify({"error": "Failed to fetch products"}), 500
+
     try:
         products = fetch_all_products()
         return jsonify(products)
@@ -56,9 +102,9 @@ def get_products():
 
 @app.route('/backup', methods=['GET'])
 def trigger_backup():
-    \"\"\"
+    """
     Trigger a manual database backup.
-    \"\"\"
+    """
     try:
         backup_database()
         return jsonify({"message": "Database backup completed."})
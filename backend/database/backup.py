@@ -1,6 +1,6 @@
 import sqlite3
-import shutil
 import os
+from contextlib import closing
 from datetime import datetime
 import logging
 
@@ -15,7 +15,10 @@ def backup_database():
         os.makedirs(BACKUP_DIR, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = os.path.join(BACKUP_DIR, f"{DB_NAME}_{timestamp}.bak")
-        shutil.copyfile(DB_NAME, backup_file)
+        # Online backup API copies pages consistently even while writers are active
+        with closing(sqlite3.connect(f"file:{DB_NAME}?mode=ro", uri=True)) as src, \
+                closing(sqlite3.connect(backup_file)) as dst:
+            src.backup(dst)
         logging.info(f"Database backed up to {backup_file}")
     except Exception as e:
         logging.error(f"Error during database backup: {e}")
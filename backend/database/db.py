@@ -3,9 +3,41 @@ import logging
 
 DB_NAME = "products.db"
 
+# Re-scraping a listing refreshes the existing row instead of adding a duplicate
+_UPSERT_PRODUCT_SQL = """
+    INSERT INTO products (title, price, description, image_urls, product_url, category, platform)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (platform, product_url) DO UPDATE SET
+        title = excluded.title,
+        price = excluded.price,
+        description = excluded.description,
+        image_urls = excluded.image_urls,
+        category = excluded.category,
+        date_scraped = CURRENT_TIMESTAMP
+"""
+
+def _connect(readonly=False):
+    """
+    Open a connection with the per-connection PRAGMAs applied.
+
+    Read paths pass readonly=True so they can never take SQLite's write lock
+    and contend with the scraper's inserts.
+    """
+    if readonly:
+        conn = sqlite3.connect(f"file:{DB_NAME}?mode=ro", uri=True, timeout=5.0)
+    else:
+        conn = sqlite3.connect(DB_NAME, timeout=5.0)
+    conn.executescript("""
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+    """)
+    return conn
+
 def initialize_db():
-    conn = sqlite3.connect(DB_NAME)
+    conn = _connect()
     cursor = conn.cursor()
+    # WAL is persistent, so readers stop blocking the scraper's writes from here on
+    cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS products (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -19,50 +51,126 @@ def initialize_db():
             date_scraped TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_products_date_scraped_id
+        ON products (date_scraped DESC, id DESC)
+    """)
+    cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_products_platform_url'"
+    )
+    if cursor.fetchone() is None:
+        # One-time migration: keep only the newest row per listing so the unique index can be built.
+        # NULLs are distinct in a unique index, so rows missing either key column are left alone.
+        cursor.execute("""
+            DELETE FROM products
+            WHERE platform IS NOT NULL
+              AND product_url IS NOT NULL
+              AND id NOT IN (
+                  SELECT MAX(id) FROM products
+                  WHERE platform IS NOT NULL AND product_url IS NOT NULL
+                  GROUP BY platform, product_url
+              )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_products_platform_url
+            ON products (platform, product_url)
+        """)
     conn.commit()
     conn.close()
     logging.info("Database initialized.")
 
+def _product_params(product):
+    return (
+        product.get("title"),
+        product.get("price"),
+        product.get("description"),
+        ",".join(filter(None, product.get("image_urls") or [])),
+        product.get("product_url"),
+        product.get("category"),
+        product.get("platform", "unknown")
+    )
+
 def add_product(product):
     try:
-        conn = sqlite3.connect(DB_NAME)
+        conn = _connect()
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO products (title, price, description, image_urls, product_url, category, platform)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            product.get("title"),
-            product.get("price"),
-            product.get("description"),
-            ",".join(product.get("image_urls", [])),
-            product.get("product_url"),
-            product.get("category"),
-            product.get("platform", "unknown")
-        ))
+        cursor.execute(_UPSERT_PRODUCT_SQL, _product_params(product))
         conn.commit()
         conn.close()
         logging.debug(f"Added product to database: {product.get('title')}")
     except Exception as e:
         logging.error(f"Error adding product to database: {e}")
 
+def add_products(products):
+    """
+    Store a batch of scraped products in a single transaction.
+    """
+    try:
+        conn = _connect()
+        with conn:
+            conn.executemany(_UPSERT_PRODUCT_SQL, [_product_params(p) for p in products])
+        conn.close()
+        logging.debug(f"Added {len(products)} products to database")
+    except Exception as e:
+        logging.error(f"Error adding products to database: {e}")
+
+def _row_to_product(row):
+    return {
+        "id": row[0],
+        "title": row[1],
+        "price": row[2],
+        "description": row[3],
+        "image_urls": row[4].split(',') if row[4] else [],
+        "product_url": row[5],
+        "category": row[6],
+        "platform": row[7],
+        "date_scraped": row[8]
+    }
+
 def fetch_all_products():
     try:
-        conn = sqlite3.connect(DB_NAME)
+        conn = _connect(readonly=True)
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM products")
         rows = cursor.fetchall()
         conn.close()
-        return [{
-            "id": row[0],
-            "title": row[1],
-            "price": row[2],
-            "description": row[3],
-            "image_urls": row[4].split(','),
-            "product_url": row[5],
-            "category": row[6],
-            "platform": row[7],
-            "date_scraped": row[8]
-        } for row in rows]
+        return [_row_to_product(row) for row in rows]
     except Exception as e:
         logging.error(f"Error fetching products: {e}")
         return []
+
+def fetch_products(limit=50, after=None):
+    """
+    Fetch one page of products, newest first, using keyset pagination.
+
+    `after` is the (date_scraped, id) pair of the last product on the previous
+    page. One extra row is fetched to tell whether another page exists, so no
+    count query is needed. Returns the page and the pair to pass in for the
+    next one, or None when there are no more products.
+    """
+    try:
+        conn = _connect(readonly=True)
+        cursor = conn.cursor()
+        if after:
+            cursor.execute("""
+                SELECT * FROM products
+                WHERE (date_scraped, id) < (?, ?)
+                ORDER BY date_scraped DESC, id DESC
+                LIMIT ?
+            """, (after[0], after[1], limit + 1))
+        else:
+            cursor.execute("""
+                SELECT * FROM products
+                ORDER BY date_scraped DESC, id DESC
+                LIMIT ?
+            """, (limit + 1,))
+        rows = cursor.fetchall()
+        conn.close()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        products = [_row_to_product(row) for row in rows]
+        next_after = (rows[-1][8], rows[-1][0]) if has_more else None
+        return products, next_after
+    except Exception as e:
+        logging.error(f"Error fetching products: {e}")
+        return [], None
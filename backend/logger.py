@@ -1,14 +1,25 @@
+import atexit
 import logging
-from logging.handlers import SMTPHandler
+from logging.handlers import QueueHandler, QueueListener, SMTPHandler
+from queue import SimpleQueue
+
+formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+
+handlers = [
+    logging.FileHandler("logs/app.log"),
+    logging.StreamHandler()
+]
+for handler in handlers:
+    handler.setFormatter(formatter)
+
+# Callers only enqueue records; file, console and email output happen on the listener thread
+log_queue = SimpleQueue()
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("logs/app.log"),
-        logging.StreamHandler()
-    ]
+    format="%(message)s",
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger()
@@ -24,10 +35,15 @@ try:
         secure=()
     )
     smtp_handler.setLevel(logging.CRITICAL)
-    logger.addHandler(smtp_handler)
+    smtp_handler.setFormatter(formatter)
+    handlers.append(smtp_handler)
 except Exception as e:
     logger.warning(f"Failed to set up SMTPHandler: {e}")
 
+listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)
+
 def log_error(message):
     logger.error(message)
 
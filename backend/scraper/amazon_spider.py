@@ -1,29 +1,51 @@
+from urllib.parse import urlencode
 import scrapy
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 from items import ProductItem
-from selenium_utils import setup_driver, save_html_backup, ProxyManager
 from logger import log_error, log_critical_error
+from scraper.cache_policies import AmazonCachePolicy
+from scraper.listing_urls import amazon_listing_url
 
 class AmazonSpider(scrapy.Spider):
     name = "amazon"
     allowed_domains = ["amazon.com"]
 
+    # Amazon marks pages no-cache, so keep them for a day instead of revalidating.
+    # Robot-check pages and error responses are never cached so retries hit the site again.
+    custom_settings = {
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_POLICY": AmazonCachePolicy,
+        "HTTPCACHE_EXPIRATION_SECS": 86400,
+        "HTTPCACHE_IGNORE_HTTP_CODES": [429, 500, 502, 503, 504],
+    }
+
     def __init__(self, query, max_items, *args, **kwargs):
         super(AmazonSpider, self).__init__(*args, **kwargs)
         self.query = query
         self.max_items = max_items
-        self.start_urls = [f"https://www.amazon.com/s?k={query.replace(' ', '+')}"]
+        self.start_urls = [f"https://www.amazon.com/s?{urlencode({'k': query})}"]
 
     def parse(self, response):
-        products = response.css(".s-main-slot .s-result-item")[:self.max_items]
-        for product in products:
+        # Sponsored and organic slots often repeat an ASIN under different URLs
+        seen_asins = set()
+        for product in response.css(".s-main-slot .s-result-item[data-asin]"):
+            asin = product.attrib.get("data-asin")
+            if not asin or asin in seen_asins:
+                continue
+            if len(seen_asins) >= self.max_items:
+                break
+            seen_asins.add(asin)
+
             item = ProductItem()
             item['title'] = product.css("h2 .a-link-normal span::text").get()
             item['price'] = product.css(".a-price span.a-offscreen::text").get()
-            item['product_url'] = response.urljoin(product.css("h2 .a-link-normal::attr(href)").get())
+            # Result hrefs carry per-search ref/qid parameters or sponsored redirects;
+            # the ASIN gives a stable URL for the listing
+            item['product_url'] = amazon_listing_url(asin)
             item['image_urls'] = [product.css(".s-image::attr(src)").get()]
             item['category'] = getattr(self, "category", "jewelry")
+            item['platform'] = self.name
 
             # Follow product URL for additional details
             details_url = item['product_url']
@@ -0,0 +1,21 @@
+import re
+from scrapy.extensions.httpcache import DummyPolicy
+
+# Amazon serves its robot check with a 200 as often as a 503
+_AMAZON_BLOCK_RE = re.compile(
+    rb"Robot Check|/errors/validateCaptcha|Type the characters you see in this image",
+    re.IGNORECASE
+)
+
+class AmazonCachePolicy(DummyPolicy):
+    """
+    Expiry-based cache that never stores Amazon's anti-bot pages.
+    """
+
+    def should_cache_response(self, response, request):
+        if not super().should_cache_response(response, request):
+            return False
+        if "/errors/validateCaptcha" in response.url:
+            return False
+        # The captcha banner sits near the top of the page, so only scan the first 64 KB
+        return not _AMAZON_BLOCK_RE.search(response.body[:65536])
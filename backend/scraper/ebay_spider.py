@@ -2,13 +2,19 @@ import scrapy
 from scrapy.crawler import CrawlerProcess
 from scrapy.utils.project import get_project_settings
 from items import ProductItem
-from selenium_utils import setup_driver, save_html_backup, ProxyManager
 from logger import log_error, log_critical_error
+from scraper.listing_urls import ebay_listing_url
 
 class EbaySpider(scrapy.Spider):
     name = "ebay"
     allowed_domains = ["ebay.com"]
 
+    # Cache responses and revalidate them with ETag/Last-Modified on re-scrapes
+    custom_settings = {
+        "HTTPCACHE_ENABLED": True,
+        "HTTPCACHE_POLICY": "scrapy.extensions.httpcache.RFC2616Policy",
+    }
+
     def __init__(self, query, max_items, *args, **kwargs):
         super(EbaySpider, self).__init__(*args, **kwargs)
         self.query = query
@@ -21,9 +27,11 @@ class EbaySpider(scrapy.Spider):
             item = ProductItem()
             item['title'] = product.css(".s-item__title::text").get()
             item['price'] = product.css(".s-item__price::text").get()
-            item['product_url'] = product.css(".s-item__link::attr(href)").get()
+            href = product.css(".s-item__link::attr(href)").get()
+            item['product_url'] = ebay_listing_url(href) if href else None
             item['image_urls'] = [product.css(".s-item__image-img::attr(src)").get()]
             item['category'] = getattr(self, "category", "jewelry")
+            item['platform'] = self.name
 
             # Follow product URL for additional details
             details_url = item['product_url']
@@ -0,0 +1,23 @@
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+_EBAY_ITEM_ID_RE = re.compile(r"/itm/(?:[^/?#]+/)?(\d+)")
+
+def ebay_listing_url(href):
+    """
+    Reduce an eBay search-result link to a stable listing URL.
+
+    Result links carry per-search tracking parameters (hash=, _trkparms=), so the
+    item number is used when present and the query string is dropped otherwise.
+    """
+    match = _EBAY_ITEM_ID_RE.search(href)
+    if match:
+        return f"https://www.ebay.com/itm/{match.group(1)}"
+    scheme, netloc, path, _, _ = urlsplit(href)
+    return urlunsplit((scheme, netloc, path, "", ""))
+
+def amazon_listing_url(asin):
+    """
+    Build the stable product URL for an Amazon ASIN.
+    """
+    return f"https://www.amazon.com/dp/{asin}"
@@ -0,0 +1,85 @@
+import base64
+import importlib
+import json
+import sys
+import types
+import pytest
+from database import db
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    # The spiders need a live Scrapy project to import; these routes never run them
+    for name, runner in (("scraper.ebay_spider", "run_ebay_spider"),
+                         ("scraper.amazon_spider", "run_amazon_spider")):
+        module = types.ModuleType(name)
+        setattr(module, runner, lambda query, max_items: [])
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "products.db"))
+    monkeypatch.delitem(sys.modules, "app", raising=False)
+    return importlib.import_module("app")
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+def add_products(count):
+    db.add_products([
+        {
+            "title": f"Gold ring {n}",
+            "image_urls": [],
+            "product_url": f"https://www.example.com/item/{n}",
+            "platform": "ebay",
+        }
+        for n in range(count)
+    ])
+
+def make_cursor(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode()
+
+def test_products_cursor_round_trip(client):
+    add_products(5)
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/products", query_string=params)
+        assert response.status_code == 200
+        body = response.get_json()
+        seen.extend(p["id"] for p in body["data"])
+        if not body["has_more"]:
+            assert body["next_cursor"] is None
+            break
+        params = {"limit": 2, "cursor": body["next_cursor"]}
+
+    assert len(seen) == len(set(seen)) == 5
+
+def test_products_without_params_returns_list(client):
+    add_products(3)
+    response = client.get("/products")
+    assert response.status_code == 200
+    assert len(response.get_json()) == 3
+
+def test_products_clamps_limit(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, "MAX_PAGE_SIZE", 2)
+    add_products(3)
+    body = client.get("/products", query_string={"limit": 1000}).get_json()
+    assert len(body["data"]) == 2
+    assert body["has_more"]
+
+@pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+def test_products_rejects_bad_limit(client, limit):
+    response = client.get("/products", query_string={"limit": limit})
+    assert response.status_code == 400
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor!",
+    make_cursor([[1], 2]),
+    make_cursor(["2024-01-01 00:00:00", "x"]),
+    make_cursor(["2024-01-01 00:00:00"]),
+    make_cursor({"a": 1}),
+])
+def test_products_rejects_bad_cursor(client, cursor):
+    response = client.get("/products", query_string={"cursor": cursor})
+    assert response.status_code == 400
@@ -0,0 +1,25 @@
+from scrapy.http import HtmlResponse, Request
+from scrapy.settings import Settings
+from scraper.cache_policies import AmazonCachePolicy
+
+def make_policy():
+    return AmazonCachePolicy(Settings({"HTTPCACHE_IGNORE_HTTP_CODES": [503]}))
+
+def make_response(url, body, status=200):
+    return HtmlResponse(url, status=status, body=body, encoding="utf-8", request=Request(url))
+
+def test_caches_product_page():
+    response = make_response("https://www.amazon.com/dp/B000000001", b"<title>Gold Ring</title>")
+    assert make_policy().should_cache_response(response, response.request)
+
+def test_skips_robot_check_served_as_200():
+    response = make_response("https://www.amazon.com/s?k=ring", b"<title>Robot Check</title>")
+    assert not make_policy().should_cache_response(response, response.request)
+
+def test_skips_captcha_url():
+    response = make_response("https://www.amazon.com/errors/validateCaptcha?amzn=x", b"<html></html>")
+    assert not make_policy().should_cache_response(response, response.request)
+
+def test_skips_ignored_status():
+    response = make_response("https://www.amazon.com/s?k=ring", b"<html></html>", status=503)
+    assert not make_policy().should_cache_response(response, response.request)
@@ -0,0 +1,113 @@
+import sqlite3
+import pytest
+from database import backup, db
+
+@pytest.fixture
+def products_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "products.db"))
+    db.initialize_db()
+    return db
+
+def make_product(n, platform="ebay"):
+    return {
+        "title": f"Gold ring {n}",
+        "price": f"${n}.00",
+        "description": "14k gold",
+        "image_urls": [f"https://img.example.com/{n}.jpg"],
+        "product_url": f"https://www.example.com/item/{n}",
+        "category": "jewelry",
+        "platform": platform,
+    }
+
+def test_fetch_products_pages_newest_first(products_db):
+    for n in range(5):
+        products_db.add_product(make_product(n))
+
+    seen = []
+    after = None
+    while True:
+        page, after = products_db.fetch_products(limit=2, after=after)
+        seen.extend(p["id"] for p in page)
+        if after is None:
+            break
+
+    assert seen == [5, 4, 3, 2, 1]
+
+def test_fetch_products_last_full_page_has_no_cursor(products_db):
+    for n in range(4):
+        products_db.add_product(make_product(n))
+
+    first, after = products_db.fetch_products(limit=2)
+    second, after = products_db.fetch_products(limit=2, after=after)
+
+    assert len(first) == len(second) == 2
+    assert after is None
+
+def test_add_product_updates_existing_listing(products_db):
+    products_db.add_product(make_product(1))
+    rescraped = make_product(1)
+    rescraped["price"] = "$2.00"
+    products_db.add_product(rescraped)
+
+    products = products_db.fetch_all_products()
+
+    assert len(products) == 1
+    assert products[0]["price"] == "$2.00"
+
+def test_add_products_stores_batch(products_db):
+    products_db.add_products([make_product(n) for n in range(3)] + [make_product(1)])
+
+    products = products_db.fetch_all_products()
+
+    assert sorted(p["title"] for p in products) == ["Gold ring 0", "Gold ring 1", "Gold ring 2"]
+
+def test_initialize_db_collapses_duplicates_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(db, "DB_NAME", str(tmp_path / "products.db"))
+    conn = sqlite3.connect(db.DB_NAME)
+    conn.execute("""
+        CREATE TABLE products (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT, price TEXT, description TEXT, image_urls TEXT,
+            product_url TEXT, category TEXT, platform TEXT,
+            date_scraped TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO products (title, product_url, platform, image_urls) VALUES (?, ?, ?, '')",
+        [
+            ("old", "https://www.ebay.com/itm/1", "ebay"),
+            ("new", "https://www.ebay.com/itm/1", "ebay"),
+            ("no platform", "https://www.ebay.com/itm/2", None),
+            ("no platform", "https://www.ebay.com/itm/2", None),
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+    db.initialize_db()
+    db.initialize_db()
+
+    titles = sorted(p["title"] for p in db.fetch_all_products())
+    assert titles == ["new", "no platform", "no platform"]
+
+def test_product_without_images_round_trips_as_empty_list(products_db):
+    product = make_product(1)
+    product["image_urls"] = []
+    products_db.add_product(product)
+
+    (stored,) = products_db.fetch_all_products()
+    assert stored["image_urls"] == []
+
+def test_backup_copies_all_rows(products_db, tmp_path, monkeypatch):
+    products_db.add_products([make_product(n) for n in range(3)])
+    # backup.py names the copy after DB_NAME, so use the relative name the app uses
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(backup, "DB_NAME", "products.db")
+
+    backup.backup_database()
+
+    (backup_file,) = (tmp_path / backup.BACKUP_DIR).iterdir()
+    conn = sqlite3.connect(backup_file)
+    rows = conn.execute("SELECT product_url FROM products ORDER BY id").fetchall()
+    conn.close()
+    assert rows == [(make_product(n)["product_url"],) for n in range(3)]
@@ -0,0 +1,11 @@
+from scraper.listing_urls import amazon_listing_url, ebay_listing_url
+
+def test_ebay_listing_url_drops_tracking():
+    href = "https://www.ebay.com/itm/Gold-Ring/123456789012?hash=item1c&_trkparms=abc"
+    assert ebay_listing_url(href) == "https://www.ebay.com/itm/123456789012"
+
+def test_ebay_listing_url_without_item_number_drops_query():
+    assert ebay_listing_url("https://www.ebay.com/p/555?iid=1") == "https://www.ebay.com/p/555"
+
+def test_amazon_listing_url_uses_asin():
+    assert amazon_listing_url("B000000001") == "https://www.amazon.com/dp/B000000001"